@@ -0,0 +1,298 @@
+"""
+뉴스 기사 본문 수집 및 텍스트 추출 모듈
+"""
+import codecs
+import requests
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from html.parser import HTMLParser
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit
+import config
+import logging
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_NEWS_HOST = "news.google.com"
+
+
+class ArticleTextParser(HTMLParser):
+    """HTML을 조각 단위로 받아 본문 문단만 모으는 스트리밍 파서"""
+
+    # 본문이 아닌 영역 (메뉴, 스크립트 등)
+    SKIP_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form", "svg", "iframe"}
+    # 닫히지 않은 <p>를 마무리하는 상위 블록
+    BLOCK_TAGS = {"div", "article", "section", "main", "body", "td", "li"}
+    # 메뉴/캡션 등 짧은 문단은 본문에서 제외
+    MIN_PARAGRAPH_LENGTH = 30
+
+    def __init__(self, max_chars: int):
+        """
+        Args:
+            max_chars: 추출할 최대 글자 수
+        """
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.paragraphs: List[str] = []
+        self.length = 0
+        self.source_url: Optional[str] = None
+        self._skip_depth = 0
+        self._in_paragraph = False
+        self._buffer: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        """최대 글자 수만큼 추출했는지 여부"""
+        return self.length >= self.max_chars
+
+    @property
+    def text(self) -> str:
+        """추출된 본문 텍스트"""
+        return "\n".join(self.paragraphs)[:self.max_chars]
+
+    def _flush_paragraph(self):
+        """모아둔 문단을 본문에 추가"""
+        paragraph = " ".join("".join(self._buffer).split())
+        if len(paragraph) >= self.MIN_PARAGRAPH_LENGTH:
+            self.paragraphs.append(paragraph)
+            self.length += len(paragraph) + 1
+        self._buffer = []
+        self._in_paragraph = False
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        # Google News 중계 페이지의 원문 주소
+        if self.source_url is None:
+            if attributes.get("data-n-au"):
+                self.source_url = attributes["data-n-au"]
+            elif tag == "link" and attributes.get("rel") == "canonical" and attributes.get("href"):
+                if urlsplit(attributes["href"]).netloc != GOOGLE_NEWS_HOST:
+                    self.source_url = attributes["href"]
+
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "p":
+            # 닫히지 않은 <p>는 다음 <p>에서 마무리
+            if self._in_paragraph:
+                self._flush_paragraph()
+            self._in_paragraph = True
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            if self._skip_depth:
+                self._skip_depth -= 1
+        elif (tag == "p" or tag in self.BLOCK_TAGS) and self._in_paragraph:
+            self._flush_paragraph()
+
+    def handle_data(self, data):
+        if self._in_paragraph and not self._skip_depth:
+            self._buffer.append(data)
+
+    def close(self):
+        super().close()
+        if self._in_paragraph:
+            self._flush_paragraph()
+
+
+class ArticleFetcher:
+    """기사 페이지를 병렬로 가져와 본문 텍스트를 추출하는 클래스"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        cache_size: Optional[int] = None
+    ):
+        """
+        Args:
+            max_workers: 동시에 가져올 최대 기사 수 (연결 풀 크기)
+            timeout: 요청 하나의 연결/읽기 제한 시간 (초)
+            max_bytes: 기사 하나에서 읽을 최대 바이트 수
+            max_chars: 기사 하나에서 추출할 최대 글자 수
+            cache_size: URL별로 캐시할 최대 기사 수
+        """
+        self.max_workers = max_workers or config.ARTICLE_FETCH_WORKERS
+        self.timeout = timeout if timeout is not None else config.ARTICLE_FETCH_TIMEOUT
+        self.max_bytes = max_bytes or config.ARTICLE_MAX_BYTES
+        self.max_chars = max_chars or config.ARTICLE_MAX_CHARS
+        self.cache_size = cache_size or config.ARTICLE_CACHE_SIZE
+
+        # 연결을 재사용하는 공용 세션
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = "Mozilla/5.0 (compatible; AIchatbot/1.0)"
+
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cache_get(self, url: str) -> Optional[str]:
+        """캐시된 본문 조회 (최근 사용 순서 갱신)"""
+        with self._cache_lock:
+            text = self._cache.get(url)
+            if text is not None:
+                self._cache.move_to_end(url)
+            return text
+
+    def _cache_put(self, url: str, text: str):
+        """본문 캐시 저장 (가장 오래된 항목부터 제거)"""
+        with self._cache_lock:
+            self._cache[url] = text
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _set_read_timeout(response, timeout: float):
+        """스트리밍 중인 응답의 소켓 읽기 제한 시간 변경"""
+        connection = getattr(getattr(response, "raw", None), "connection", None)
+        sock = getattr(connection, "sock", None)
+        if sock is not None:
+            sock.settimeout(timeout)
+
+    def _read_page(self, url: str, deadline: float, cancel: threading.Event):
+        """
+        페이지를 스트리밍으로 읽으며 파싱 (크기/시간 제한, 취소 시 즉시 중단)
+
+        Returns:
+            (최종 URL, 파서, 끝까지 읽었는지 여부) 튜플
+            (스트림 끝, 최대 글자 수, 최대 바이트 수에 도달하면 끝까지 읽은 것으로 봄)
+        """
+        parser = ArticleTextParser(self.max_chars)
+        # 연결/첫 응답 대기도 남은 시간 안에서만 허용
+        remaining = deadline - time.monotonic()
+        if cancel.is_set() or remaining <= 0:
+            return url, parser, False
+        with self.session.get(url, timeout=min(self.timeout, remaining), stream=True) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            if "html" not in content_type:
+                return response.url, parser, True
+
+            # charset이 없으면 requests가 ISO-8859-1로 가정하므로 UTF-8 사용
+            encoding = response.encoding if "charset" in content_type.lower() else "utf-8"
+            try:
+                decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            except LookupError:
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+            complete = True
+            received = 0
+            chunks = response.iter_content(chunk_size=16384)
+            while True:
+                # 읽기마다 남은 시간으로 제한해 마감 이후로 멈춰 있지 않도록 함
+                remaining = deadline - time.monotonic()
+                if cancel.is_set() or remaining <= 0:
+                    complete = False
+                    break
+                self._set_read_timeout(response, min(self.timeout, remaining))
+                try:
+                    chunk = next(chunks, None)
+                except requests.exceptions.RequestException:
+                    if time.monotonic() < deadline:
+                        raise
+                    complete = False
+                    break
+                if chunk is None:
+                    break
+                received += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if parser.done or received >= self.max_bytes:
+                    break
+
+            parser.close()
+            return response.url, parser, complete
+
+    def fetch_text(self, url: str, deadline: float, cancel: threading.Event) -> str:
+        """
+        기사 본문 텍스트 추출 (Google News 중계 링크는 원문 주소로 해석)
+
+        Args:
+            url: 기사 링크
+            deadline: 작업 마감 시각 (time.monotonic 기준)
+            cancel: 작업 취소 신호
+
+        Returns:
+            본문 텍스트 (추출 실패 시 빈 문자열, 중간에 멈춘 경우 읽은 부분까지)
+        """
+        cached = self._cache_get(url)
+        if cached is not None:
+            return cached
+
+        final_url, parser, complete = self._read_page(url, deadline, cancel)
+        if urlsplit(final_url).netloc == GOOGLE_NEWS_HOST:
+            # 중계 페이지에서 원문 주소를 찾지 못한 경우 생략
+            if not parser.source_url:
+                if complete:
+                    logger.debug(f"[ARTICLE] 중계 페이지에서 원문 주소를 찾지 못함: {url}")
+                return ""
+            final_url, parser, complete = self._read_page(parser.source_url, deadline, cancel)
+
+        text = parser.text
+        # 중간에 멈춘 본문은 캐시하지 않음
+        if text and complete:
+            self._cache_put(url, text)
+        return text
+
+    def enrich(self, news_list: List[Dict], max_articles: int = 5, budget: Optional[float] = None) -> List[Dict]:
+        """
+        뉴스 항목에 기사 본문을 'content' 필드로 추가
+
+        Args:
+            news_list: 뉴스 정보 리스트
+            max_articles: 본문을 가져올 최대 기사 수
+            budget: 전체 단계의 최대 소요 시간 (초)
+
+        Returns:
+            본문이 추가된 뉴스 정보 리스트 (시간 내 완료된 기사만 추가)
+        """
+        budget = budget if budget is not None else config.ARTICLE_FETCH_BUDGET
+        deadline = time.monotonic() + budget
+        cancel = threading.Event()
+
+        futures = {
+            self.executor.submit(self.fetch_text, news["link"], deadline, cancel): news
+            for news in news_list[:max_articles]
+            if news.get("link")
+        }
+        if not futures:
+            return news_list
+
+        done, not_done = wait(futures, timeout=budget)
+        # 남은 작업은 취소하고 진행 중인 작업은 다음 조각에서 중단
+        cancel.set()
+        for future in not_done:
+            future.cancel()
+        if not_done:
+            logger.warning(f"[ARTICLE] 제한 시간 초과로 {len(not_done)}개 기사 본문 생략")
+
+        for future in done:
+            try:
+                text = future.result()
+            except Exception as e:
+                logger.error(f"[ARTICLE] 기사 본문 수집 실패: {str(e)}")
+                continue
+            if text:
+                futures[future]["content"] = text
+
+        return news_list
+
+
+_shared_fetcher: Optional[ArticleFetcher] = None
+_shared_fetcher_lock = threading.Lock()
+
+
+def get_shared_fetcher() -> ArticleFetcher:
+    """프로세스 전체에서 공유하는 기사 본문 수집기 반환 (스레드 풀, 연결 풀, URL 캐시 공유)"""
+    global _shared_fetcher
+    with _shared_fetcher_lock:
+        if _shared_fetcher is None:
+            _shared_fetcher = ArticleFetcher()
+        return _shared_fetcher
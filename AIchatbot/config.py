@@ -14,7 +14,27 @@ OPENAI_BASE_URL = "https://gms.ssafy.io/gmsapi/api.openai.com/v1"
 
 # Google News 설정
 GOOGLE_NEWS_LANG = os.getenv("GOOGLE_NEWS_LANG", "en")
-GOOGLE_NEWS_RSS_URL = f"https://news.google.com/rss?hl={GOOGLE_NEWS_LANG}"
+GOOGLE_NEWS_BASE_URL = "https://news.google.com/rss"
+
+# 동시에 검색할 언어-지역 에디션 목록 (예: "ko-KR,en-US,ja-JP", 지역 생략 가능)
+GOOGLE_NEWS_EDITIONS = list(dict.fromkeys(
+    edition.strip()
+    for edition in os.getenv("GOOGLE_NEWS_EDITIONS", f"ko-KR,{GOOGLE_NEWS_LANG}").split(",")
+    if edition.strip()
+)) or [GOOGLE_NEWS_LANG]
+# 에디션 하나당 최대 대기 시간 (초)
+GOOGLE_NEWS_TIMEOUT = float(os.getenv("GOOGLE_NEWS_TIMEOUT", "5"))
+
+# 기사 본문 수집 설정 (분석 품질 향상용 선택 단계, 기본값: 사용 안 함)
+ARTICLE_FETCH_ENABLED = os.getenv("ARTICLE_FETCH_ENABLED", "false").lower() == "true"
+ARTICLE_FETCH_WORKERS = int(os.getenv("ARTICLE_FETCH_WORKERS", "5"))
+# 요청 하나의 연결/읽기 제한 시간과 전체 단계의 최대 소요 시간 (초)
+ARTICLE_FETCH_TIMEOUT = float(os.getenv("ARTICLE_FETCH_TIMEOUT", "3"))
+ARTICLE_FETCH_BUDGET = float(os.getenv("ARTICLE_FETCH_BUDGET", "6"))
+# 기사 하나에서 읽을 최대 바이트 수와 추출할 최대 글자 수
+ARTICLE_MAX_BYTES = int(os.getenv("ARTICLE_MAX_BYTES", "1000000"))
+ARTICLE_MAX_CHARS = int(os.getenv("ARTICLE_MAX_CHARS", "3000"))
+ARTICLE_CACHE_SIZE = int(os.getenv("ARTICLE_CACHE_SIZE", "256"))
 
 # 애플리케이션 설정
 APP_TITLE = "AI 기사 검색 통합 챗봇"
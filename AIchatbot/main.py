@@ -4,6 +4,7 @@ ChatGPT/Gemini 스타일의 통합 뉴스 검색 챗봇
 """
 import streamlit as st
 from news_crawler import NewsCrawler
+from article_fetcher import get_shared_fetcher
 from chatbot import AIchatbot
 import config
 import logging
@@ -12,6 +13,37 @@ from datetime import datetime
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 사이드바 스타일 (미니멀 디자인)
+SIDEBAR_STYLE = """
+<style>
+.new-chat-btn {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    gap: 8px;
+    padding: 10px 16px;
+    background: #f0f0f0;
+    border: 1px solid #e0e0e0;
+    border-radius: 6px;
+    cursor: pointer;
+    font-size: 14px;
+    font-weight: 500;
+    transition: all 0.2s ease;
+    width: 100%;
+    text-align: center;
+    color: #333;
+    text-decoration: none;
+}
+.new-chat-btn:hover {
+    background: #e8e8e8;
+    border-color: #d0d0d0;
+}
+</style>
+"""
+
+# 활성 영역에 둘 최대 메시지 수 (초과 시 전체 재실행으로 히스토리에 편입)
+MAX_ACTIVE_MESSAGES = 10
+
 
 def initialize_session_state():
     """Streamlit 세션 상태 초기화"""
@@ -19,7 +51,9 @@ def initialize_session_state():
         st.session_state.chatbot = AIchatbot()
     
     if "crawler" not in st.session_state:
-        st.session_state.crawler = NewsCrawler(language="kor")
+        # 기사 본문 수집기는 모든 브라우저 세션이 하나를 공유
+        article_fetcher = get_shared_fetcher() if config.ARTICLE_FETCH_ENABLED else None
+        st.session_state.crawler = NewsCrawler(article_fetcher=article_fetcher)
     
     if "messages" not in st.session_state:
         st.session_state.messages = []
@@ -29,6 +63,9 @@ def initialize_session_state():
     
     if "current_session_id" not in st.session_state:
         st.session_state.current_session_id = None
+    
+    if "history_size" not in st.session_state:
+        st.session_state.history_size = 0
 
 
 def get_related_topics(keyword):
@@ -62,19 +99,19 @@ def get_related_topics(keyword):
         return [keyword, f"{keyword} 관련", f"{keyword} 뉴스"]
 
 
-def display_news_by_topic(keyword):
-    """주제별 뉴스를 귀여운 표 디자인으로 표시"""
+def build_news_blocks(keyword):
+    """주제별 뉴스를 귀여운 표 디자인의 렌더링 블록 목록으로 생성"""
     logger.info(f"[NEWS] '{keyword}' 관련 주제별 뉴스 검색 시작")
     
     # 메인 제목
-    st.markdown(f"## 📰 '{keyword}' 관련 뉴스")
+    blocks = [("markdown", f"## 📰 '{keyword}' 관련 뉴스")]
     
     # 관련 주제 3개 생성
     topics = get_related_topics(keyword)
     
     # 각 주제별로 뉴스 검색
     for topic in topics:
-        st.subheader(f"🔷 {topic}")
+        blocks.append(("subheader", f"🔷 {topic}"))
         
         news_list = st.session_state.crawler.search_news(topic, max_results=5)
         
@@ -88,167 +125,115 @@ def display_news_by_topic(keyword):
                 table_data += f"| {idx} | {news['title'][:50]} | {news['source'][:15]} | {news['published'][:10]} | "
                 table_data += f'<a href="{news["link"]}" target="_blank" style="text-decoration: none;"><button style="background: #667eea; color: white; border: none; border-radius: 4px; padding: 4px 8px; cursor: pointer; font-size: 12px;">읽기</button></a> |\n'
             
-            st.markdown(table_data, unsafe_allow_html=True)
+            blocks.append(("html", table_data))
         else:
-            st.info(f"'{topic}' 관련 뉴스가 없습니다.")
+            blocks.append(("info", f"'{topic}' 관련 뉴스가 없습니다."))
         
-        st.divider()  # 주제 간 구분선
+        blocks.append(("divider", ""))  # 주제 간 구분선
+    
+    return blocks
 
 
-def main():
-    """메인 애플리케이션"""
-    st.set_page_config(
-        page_title=config.APP_TITLE,
-        page_icon="🤖",
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
-    
-    # 세션 상태 초기화
-    initialize_session_state()
+def render_blocks(blocks):
+    """미리 생성된 렌더링 블록을 화면에 표시"""
+    for kind, body in blocks:
+        if kind == "subheader":
+            st.subheader(body)
+        elif kind == "info":
+            st.info(body)
+        elif kind == "divider":
+            st.divider()
+        elif kind == "html":
+            st.markdown(body, unsafe_allow_html=True)
+        else:
+            st.markdown(body)
+
+
+def render_message(message):
+    """메시지 한 개를 표시 (저장된 렌더링 블록이 있으면 그대로 재사용)"""
+    with st.chat_message(message["role"]):
+        render_blocks(message.get("blocks") or [("markdown", message["content"])])
+
+
+def start_new_chat():
+    """현재 대화를 저장하고 새 대화 시작"""
+    session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if st.session_state.messages:  # 현재 대화가 있으면 저장
+        st.session_state.conversation_history[session_id] = st.session_state.messages
+    st.session_state.current_session_id = None
+    st.session_state.messages = []
+    st.session_state.chatbot.reset_conversation()
+
+
+def delete_session(session_id):
+    """저장된 대화 삭제 (버튼 콜백으로 사이드바가 다시 그려지기 전에 실행)"""
+    st.session_state.conversation_history.pop(session_id, None)
+
+
+@st.fragment
+def render_sidebar():
+    """사이드바: 대화 히스토리 관리 (ChatGPT 스타일, 이 영역의 클릭은 사이드바만 재실행)"""
+    if st.button("➕ 새 대화", use_container_width=True, key="new_chat"):
+        start_new_chat()
+        st.rerun()
     
-    # 사이드바: 대화 히스토리 관리 (ChatGPT 스타일)
-    with st.sidebar:
-        # 새 대화 시작 버튼 (미니멀 디자인)
-        st.markdown("""
-        <style>
-        .new-chat-btn {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 8px;
-            padding: 10px 16px;
-            background: #f0f0f0;
-            border: 1px solid #e0e0e0;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 14px;
-            font-weight: 500;
-            transition: all 0.2s ease;
-            width: 100%;
-            text-align: center;
-            color: #333;
-            text-decoration: none;
-        }
-        .new-chat-btn:hover {
-            background: #e8e8e8;
-            border-color: #d0d0d0;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+    # 저장된 대화 목록
+    if st.session_state.conversation_history:
+        st.markdown("**이전 대화**")
+        st.markdown("")  # 간격
         
-        if st.button("➕ 새 대화", use_container_width=True, key="new_chat"):
-            session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-            if st.session_state.messages:  # 현재 대화가 있으면 저장
-                st.session_state.conversation_history[session_id] = st.session_state.messages
-            st.session_state.current_session_id = None
-            st.session_state.messages = []
-            st.session_state.chatbot.reset_conversation()
-            st.rerun()
-        
-        # 저장된 대화 목록
-        if st.session_state.conversation_history:
-            st.markdown("**이전 대화**")
-            st.markdown("")  # 간격
+        for session_id in reversed(sorted(st.session_state.conversation_history.keys())):
+            session_messages = st.session_state.conversation_history[session_id]
             
-            for session_id in reversed(sorted(st.session_state.conversation_history.keys())):
-                session_messages = st.session_state.conversation_history[session_id]
-                
-                if session_messages:
-                    # 첫 사용자 메시지를 제목으로
-                    user_messages = [m for m in session_messages if m["role"] == "user"]
-                    if user_messages:
-                        preview = user_messages[0].get("content", "대화")[:20]
-                        date_time = session_id[:4] + "-" + session_id[4:6] + "-" + session_id[6:8] + " " + session_id[9:11] + ":" + session_id[11:13]
-                        
-                        col1, col2 = st.columns([4, 1])
-                        with col1:
-                            if st.button(f"💬 {preview}...", use_container_width=True, key=f"session_{session_id}"):
-                                st.session_state.current_session_id = session_id
-                                st.session_state.messages = session_messages
-                                st.rerun()
-                        with col2:
-                            if st.button("🗑️", key=f"delete_{session_id}"):
-                                del st.session_state.conversation_history[session_id]
-                                st.rerun()
-        else:
-            st.markdown("")
-            st.markdown("---")
-            st.markdown('<div style="text-align: center; color: #999; font-size: 12px; margin-top: 20px;">새 대화를 시작하세요</div>', unsafe_allow_html=True)
-    
-    # 메인 영역
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.title(f"🤖 {config.APP_TITLE}")
-    
-    st.markdown(f"*{config.APP_DESCRIPTION}*")
-    st.divider()
-    
-    # 대화 히스토리 표시
-    chat_container = st.container()
-    with chat_container:
-        for message in st.session_state.messages:
-            with st.chat_message(message["role"]):
-                # 뉴스 검색 결과인 경우
-                if message.get("is_news") and message.get("keyword"):
-                    display_news_by_topic(message["keyword"])
-                    st.markdown("---")
-                    st.markdown("### 🎯 AI 뉴스 분석")
-                    # AI 분석 부분만 표시
-                    analysis_text = message["content"].split("\n\n", 1)[1] if "\n\n" in message["content"] else message["content"]
-                    st.markdown(analysis_text)
-                else:
-                    st.markdown(message["content"])
+            if session_messages:
+                # 첫 사용자 메시지를 제목으로
+                user_messages = [m for m in session_messages if m["role"] == "user"]
+                if user_messages:
+                    preview = user_messages[0].get("content", "대화")[:20]
+                    
+                    col1, col2 = st.columns([4, 1])
+                    with col1:
+                        if st.button(f"💬 {preview}...", use_container_width=True, key=f"session_{session_id}"):
+                            st.session_state.current_session_id = session_id
+                            st.session_state.messages = session_messages
+                            st.rerun()
+                    with col2:
+                        st.button("🗑️", key=f"delete_{session_id}", on_click=delete_session, args=(session_id,))
+    else:
+        st.markdown("")
+        st.markdown("---")
+        st.markdown('<div style="text-align: center; color: #999; font-size: 12px; margin-top: 20px;">새 대화를 시작하세요</div>', unsafe_allow_html=True)
+
+
+def answer_news(keyword):
+    """뉴스 검색 결과와 AI 분석을 표시하고 렌더링 블록과 분석 결과 반환"""
+    news_list = st.session_state.crawler.search_news(keyword, max_results=10)
     
-    # 사용자 입력
-    user_input = st.chat_input("메시지를 입력하세요... (예: 'AI 뉴스 찾아줘' 또는 '안녕하세요')")
+    if not news_list:
+        return None, None
     
-    if user_input:
-        # 사용자 메시지 저장
-        logger.debug(f"[USER_INPUT] 사용자 입력: {user_input}")
-        st.session_state.messages.append({"role": "user", "content": user_input})
+    # AI 응답 시작 (직접 표시)
+    with st.chat_message("assistant"):
+        # 뉴스 테이블 표시
+        blocks = build_news_blocks(keyword)
+        render_blocks(blocks)
         
-        # 현재 세션에도 저장
-        if st.session_state.current_session_id:
-            st.session_state.conversation_history[st.session_state.current_session_id] = st.session_state.messages
+        # AI 분석 표시
+        analysis_header = [("markdown", "---"), ("markdown", "### 🎯 AI 뉴스 분석")]
+        render_blocks(analysis_header)
         
-        # 사용자 메시지 표시
-        with st.chat_message("user"):
-            st.markdown(user_input)
+        # 기사 본문 수집 (제한 시간 내 가져온 기사만 본문 사용)
+        if config.ARTICLE_FETCH_ENABLED:
+            st.session_state.crawler.enrich_news(news_list, max_articles=5)
         
-        # AI 응답 생성을 위한 컨테이너
-        response_container = st.container()
+        # 뉴스 내용을 텍스트로 변환 (본문이 없으면 RSS 요약 사용)
+        news_content = "\n".join([
+            f"- {news['title']}: {news['content'][:800] if news.get('content') else news.get('summary', '')[:100]}"
+            for news in news_list[:5]
+        ])
         
-        with st.spinner("처리 중입니다..."):
-            # 1. 뉴스 검색 여부 판단
-            is_news_search = st.session_state.chatbot.should_search_news(user_input)
-            
-            if is_news_search:
-                # 2. 키워드 추출
-                keyword = st.session_state.chatbot.extract_news_keyword(user_input)
-                
-                if keyword:
-                    # 3. 뉴스 검색
-                    news_list = st.session_state.crawler.search_news(keyword, max_results=10)
-                    
-                    if news_list:
-                        # AI 응답 시작 (직접 표시)
-                        with st.chat_message("assistant"):
-                            # 뉴스 테이블 표시
-                            display_news_by_topic(keyword)
-                            
-                            # AI 분석 표시
-                            st.markdown("---")
-                            st.markdown("### 🎯 AI 뉴스 분석")
-                            
-                            # 뉴스 내용을 텍스트로 변환
-                            news_content = "\n".join([
-                                f"- {news['title']}: {news.get('summary', '')[:100]}"
-                                for news in news_list[:5]
-                            ])
-                            
-                            # AI에게 뉴스 분석 요청
-                            analysis_prompt = f"""
+        # AI에게 뉴스 분석 요청
+        analysis_prompt = f"""
 사용자가 '{keyword}'에 대한 뉴스를 요청했습니다.
 
 검색된 뉴스 요약:
@@ -264,40 +249,125 @@ def main():
 
 모든 텍스트에 이모지와 **볼드체**를 적절히 활용해서 재미있고 흥미롭게 작성해주세요.
 """
-                            
-                            ai_analysis = st.session_state.chatbot.chat(analysis_prompt, include_history=False)
-                            st.markdown(ai_analysis)
-                        
-                        full_response = f"'{keyword}' 관련 뉴스 10개를 찾았습니다.\n\n{ai_analysis}"
-                        
-                        # 뉴스 메타데이터와 함께 메시지 저장
-                        st.session_state.messages.append({
-                            "role": "assistant", 
-                            "content": full_response,
-                            "is_news": True,
-                            "keyword": keyword
-                        })
-                    else:
-                        error_msg = f"죄송합니다. '{keyword}' 관련 뉴스를 찾을 수 없습니다."
-                        with st.chat_message("assistant"):
-                            st.markdown(error_msg)
-                        st.session_state.messages.append({"role": "assistant", "content": error_msg})
-                else:
-                    error_msg = "죄송합니다. 검색 키워드를 추출할 수 없습니다. 다시 시도해주세요."
-                    with st.chat_message("assistant"):
-                        st.markdown(error_msg)
-                    st.session_state.messages.append({"role": "assistant", "content": error_msg})
+        
+        ai_analysis = st.session_state.chatbot.chat(analysis_prompt, include_history=False)
+        st.markdown(ai_analysis)
+    
+    return blocks + analysis_header + [("markdown", ai_analysis)], ai_analysis
+
+
+def reply(content):
+    """어시스턴트 메시지를 표시하고 저장"""
+    message = {"role": "assistant", "content": content}
+    render_message(message)
+    st.session_state.messages.append(message)
+
+
+def handle_user_input(user_input):
+    """사용자 입력을 처리하고 응답 생성"""
+    # 사용자 메시지 저장
+    logger.debug(f"[USER_INPUT] 사용자 입력: {user_input}")
+    user_message = {"role": "user", "content": user_input}
+    st.session_state.messages.append(user_message)
+    
+    # 현재 세션에도 저장
+    if st.session_state.current_session_id:
+        st.session_state.conversation_history[st.session_state.current_session_id] = st.session_state.messages
+    
+    # 사용자 메시지 표시
+    render_message(user_message)
+    
+    with st.spinner("처리 중입니다..."):
+        # 1. 뉴스 검색 여부 판단
+        is_news_search = st.session_state.chatbot.should_search_news(user_input)
+        
+        if is_news_search:
+            # 2. 키워드 추출
+            keyword = st.session_state.chatbot.extract_news_keyword(user_input)
             
+            if keyword:
+                # 3. 뉴스 검색 및 분석
+                blocks, ai_analysis = answer_news(keyword)
+                
+                if blocks:
+                    full_response = f"'{keyword}' 관련 뉴스 10개를 찾았습니다.\n\n{ai_analysis}"
+                    
+                    # 뉴스 메타데이터와 렌더링 블록을 함께 저장 (히스토리에서 재검색 없이 표시)
+                    st.session_state.messages.append({
+                        "role": "assistant", 
+                        "content": full_response,
+                        "is_news": True,
+                        "keyword": keyword,
+                        "blocks": blocks
+                    })
+                else:
+                    reply(f"죄송합니다. '{keyword}' 관련 뉴스를 찾을 수 없습니다.")
             else:
-                # 일반 대화
-                response = st.session_state.chatbot.chat(user_input)
-                with st.chat_message("assistant"):
-                    st.markdown(response)
-                st.session_state.messages.append({"role": "assistant", "content": response})
+                reply("죄송합니다. 검색 키워드를 추출할 수 없습니다. 다시 시도해주세요.")
+        
+        else:
+            # 일반 대화
+            reply(st.session_state.chatbot.chat(user_input))
+    
+    # 현재 세션에 저장
+    if st.session_state.current_session_id:
+        st.session_state.conversation_history[st.session_state.current_session_id] = st.session_state.messages
+
+
+@st.fragment
+def render_active_turn():
+    """히스토리 이후의 메시지와 사용자 입력 처리 (입력 시 이 영역만 재실행)"""
+    turn_container = st.container()
+    
+    # 사용자 입력 (프래그먼트 안에서는 화면 하단에 고정되지 않고 현재 대화 아래에 표시됨,
+    # main()에서 읽으면 입력마다 전체 페이지가 다시 실행되므로 이 위치를 유지)
+    user_input = st.chat_input("메시지를 입력하세요... (예: 'AI 뉴스 찾아줘' 또는 '안녕하세요')")
+    
+    with turn_container:
+        for message in st.session_state.messages[st.session_state.history_size:]:
+            render_message(message)
         
-        # 현재 세션에 저장
-        if st.session_state.current_session_id:
-            st.session_state.conversation_history[st.session_state.current_session_id] = st.session_state.messages
+        if user_input:
+            handle_user_input(user_input)
+    
+    # 활성 영역이 커지면 전체 재실행으로 히스토리에 편입해 재실행 비용을 일정하게 유지
+    if len(st.session_state.messages) - st.session_state.history_size > MAX_ACTIVE_MESSAGES:
+        st.rerun()
+
+
+def main():
+    """메인 애플리케이션"""
+    st.set_page_config(
+        page_title=config.APP_TITLE,
+        page_icon="🤖",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # 세션 상태 초기화
+    initialize_session_state()
+    
+    # 사이드바 (스타일은 전체 재실행 시에만 전송)
+    with st.sidebar:
+        st.markdown(SIDEBAR_STYLE, unsafe_allow_html=True)
+        render_sidebar()
+    
+    # 메인 영역
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.title(f"🤖 {config.APP_TITLE}")
+    
+    st.markdown(f"*{config.APP_DESCRIPTION}*")
+    st.divider()
+    
+    # 대화 히스토리 표시 (전체 재실행 시에만 그려지고 이후 입력에서는 고정)
+    st.session_state.history_size = len(st.session_state.messages)
+    with st.container():
+        for message in st.session_state.messages:
+            render_message(message)
+    
+    # 현재 대화 턴
+    render_active_turn()
 
 
 if __name__ == "__main__":
@@ -3,107 +3,250 @@ Google News RSS 기반 뉴스 수집 모듈
 """
 import feedparser
 import requests
-from datetime import datetime
-from typing import List, Dict
-from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional
+from urllib.parse import quote, urlsplit, urlunsplit
+from article_fetcher import ArticleFetcher, get_shared_fetcher
+import config
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class NewsCrawler:
     """Google News에서 뉴스를 수집하는 클래스"""
-    
-    def __init__(self, language: str = "kor"):
+
+    def __init__(
+        self,
+        editions: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+        article_fetcher: Optional[ArticleFetcher] = None
+    ):
+        """
+        Args:
+            editions: 검색할 언어-지역 에디션 목록 (예: ["ko-KR", "en-US"], 기본값: config 설정)
+            timeout: 에디션 하나당 최대 대기 시간 (초)
+            article_fetcher: 기사 본문 수집기 (기본값: 프로세스 공용 수집기)
         """
+        self.editions = editions or config.GOOGLE_NEWS_EDITIONS
+        self.timeout = timeout if timeout is not None else config.GOOGLE_NEWS_TIMEOUT
+        self.base_url = config.GOOGLE_NEWS_BASE_URL
+        self.article_fetcher = article_fetcher
+
+    @staticmethod
+    def _edition_params(edition: str) -> str:
+        """
+        에디션 문자열을 Google News 쿼리 파라미터로 변환
+
         Args:
-            language: 뉴스 언어 (기본값: 한국어)
+            edition: "ko-KR" 형식의 언어-지역 코드 (지역 생략 가능)
+
+        Returns:
+            hl/gl/ceid 쿼리 문자열
+        """
+        language, _, region = edition.partition("-")
+        if not region:
+            return f"hl={language}"
+        return f"hl={edition}&gl={region}&ceid={region}:{language}"
+
+    @staticmethod
+    def _parse_published(entry) -> Optional[datetime]:
+        """RSS 항목의 발행 시각을 UTC datetime으로 변환"""
+        parsed = entry.get("published_parsed")
+        if parsed:
+            return datetime(*parsed[:6], tzinfo=timezone.utc)
+
+        published = entry.get("published", "")
+        if not published:
+            return None
+        try:
+            published_at = parsedate_to_datetime(published)
+        except (TypeError, ValueError):
+            return None
+        if published_at.tzinfo is None:
+            published_at = published_at.replace(tzinfo=timezone.utc)
+        return published_at.astimezone(timezone.utc)
+
+    @staticmethod
+    def _dedup_key(link: str) -> str:
+        """중복 판별용 링크 (Google News 링크는 에디션별로 달라지는 쿼리 문자열 제거)"""
+        parts = urlsplit(link)
+        if parts.netloc != "news.google.com":
+            return link
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+    def _fetch_edition(self, url: str, edition: str) -> List[Dict]:
+        """
+        에디션 하나의 RSS 피드를 가져와 뉴스 항목으로 변환
+
+        Args:
+            url: 에디션 파라미터를 제외한 RSS URL
+            edition: 언어-지역 코드
+
+        Returns:
+            뉴스 정보 리스트
+        """
+        separator = "&" if "?" in url else "?"
+        response = requests.get(
+            f"{url}{separator}{self._edition_params(edition)}",
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
+
+        news_list = []
+        for entry in feed.entries:
+            published_at = self._parse_published(entry)
+            news_item = {
+                "title": entry.get("title", "No Title"),
+                "link": entry.get("link", ""),
+                "published": published_at.strftime("%Y-%m-%d %H:%M") if published_at else "",
+                "published_at": published_at,
+                "summary": entry.get("summary", ""),
+                "source": entry.get("source", {}).get("title", "Unknown Source"),
+                "edition": edition
+            }
+            news_list.append(news_item)
+
+        return news_list
+
+    def _collect(self, url: str, max_results: int, editions: Optional[List[str]] = None) -> List[Dict]:
+        """
+        여러 에디션을 동시에 조회한 뒤 링크 기준으로 중복을 제거하고 최신순으로 정렬
+
+        Args:
+            url: 에디션 파라미터를 제외한 RSS URL
+            max_results: 최대 결과 수
+            editions: 조회할 에디션 목록 (기본값: 인스턴스 설정)
+
+        Returns:
+            병합된 뉴스 정보 리스트
         """
-        self.language = language
-        self.base_url = f"https://news.google.com/rss"
-    
-    def search_news(self, keyword: str, max_results: int = 10) -> List[Dict]:
+        editions = editions or self.editions
+        executor = ThreadPoolExecutor(max_workers=len(editions))
+        futures = {
+            executor.submit(self._fetch_edition, url, edition): edition
+            for edition in editions
+        }
+        # 모든 에디션이 병렬로 진행되므로 전체 대기 시간이 곧 에디션당 제한 시간
+        done, not_done = wait(futures, timeout=self.timeout)
+        # 느린 에디션이 끝날 때까지 기다리지 않고 반환
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        for future in not_done:
+            logger.warning(f"[NEWS] '{futures[future]}' 에디션 응답 시간 초과")
+
+        merged = {}
+        for future in done:
+            try:
+                news_list = future.result()
+            except Exception as e:
+                logger.error(f"[NEWS] '{futures[future]}' 에디션 조회 실패: {str(e)}")
+                continue
+            for news in news_list:
+                key = self._dedup_key(news["link"])
+                known = merged.get(key)
+                # 같은 기사는 발행 시각 정보가 있는 쪽을 유지
+                if known is None or (known["published_at"] is None and news["published_at"] is not None):
+                    merged[key] = news
+
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        ranked = sorted(
+            merged.values(),
+            key=lambda news: news["published_at"] or oldest,
+            reverse=True
+        )
+        return ranked[:max_results]
+
+    def search_news(self, keyword: str, max_results: int = 10, editions: Optional[List[str]] = None) -> List[Dict]:
         """
         키워드로 뉴스 검색
-        
+
         Args:
             keyword: 검색 키워드
             max_results: 최대 결과 수
-            
+            editions: 검색할 언어-지역 에디션 목록 (기본값: 인스턴스 설정)
+
         Returns:
-            뉴스 정보 리스트
+            최신순으로 정렬된 뉴스 정보 리스트
         """
         try:
             # URL 인코딩 처리 (한글/영문 모두 대응)
             encoded_keyword = quote(keyword, safe='')
-            
+
             # Google News 검색 RSS URL
-            search_url = f"{self.base_url}/search?q={encoded_keyword}&hl={self.language}"
-            
-            # RSS 피드 파싱
-            feed = feedparser.parse(search_url)
-            
-            news_list = []
-            for entry in feed.entries[:max_results]:
-                news_item = {
-                    "title": entry.get("title", "No Title"),
-                    "link": entry.get("link", ""),
-                    "published": entry.get("published", ""),
-                    "summary": entry.get("summary", ""),
-                    "source": entry.get("source", {}).get("title", "Unknown Source")
-                }
-                news_list.append(news_item)
-            
-            return news_list
-            
+            search_url = f"{self.base_url}/search?q={encoded_keyword}"
+
+            return self._collect(search_url, max_results, editions)
+
         except Exception as e:
             print(f"뉴스 검색 중 오류 발생: {e}")
             return []
-    
-    def get_latest_news(self, max_results: int = 10) -> List[Dict]:
+
+    def get_latest_news(self, max_results: int = 10, editions: Optional[List[str]] = None) -> List[Dict]:
         """
         최신 뉴스 조회
-        
+
         Args:
             max_results: 최대 결과 수
-            
+            editions: 조회할 언어-지역 에디션 목록 (기본값: 인스턴스 설정)
+
         Returns:
             최신 뉴스 리스트
         """
         try:
-            feed = feedparser.parse(self.base_url)
-            
-            news_list = []
-            for entry in feed.entries[:max_results]:
-                news_item = {
-                    "title": entry.get("title", "No Title"),
-                    "link": entry.get("link", ""),
-                    "published": entry.get("published", ""),
-                    "summary": entry.get("summary", ""),
-                    "source": entry.get("source", {}).get("title", "Unknown Source")
-                }
-                news_list.append(news_item)
-            
-            return news_list
-            
+            return self._collect(self.base_url, max_results, editions)
+
         except Exception as e:
             print(f"최신 뉴스 조회 중 오류 발생: {e}")
             return []
 
+    def enrich_news(self, news_list: List[Dict], max_articles: int = 5, budget: Optional[float] = None) -> List[Dict]:
+        """
+        뉴스 링크의 기사 본문을 가져와 'content' 필드로 추가 (선택 단계)
+
+        Args:
+            news_list: 뉴스 정보 리스트
+            max_articles: 본문을 가져올 최대 기사 수
+            budget: 전체 단계의 최대 소요 시간 (초)
+
+        Returns:
+            본문이 추가된 뉴스 정보 리스트
+        """
+        try:
+            # 세션마다 스레드/연결 풀을 만들지 않도록 공용 수집기 사용
+            fetcher = self.article_fetcher or get_shared_fetcher()
+            return fetcher.enrich(news_list, max_articles, budget)
+
+        except Exception as e:
+            print(f"기사 본문 수집 중 오류 발생: {e}")
+            return news_list
+
 
 if __name__ == "__main__":
     # 테스트용 코드
-    crawler = NewsCrawler(language="en")
-    
+    crawler = NewsCrawler(editions=["ko-KR", "en-US"])
+
     # 최신 뉴스 조회
     print("=== 최신 뉴스 ===")
     latest = crawler.get_latest_news(max_results=5)
     for news in latest:
         print(f"제목: {news['title']}")
-        print(f"출처: {news['source']}")
+        print(f"출처: {news['source']} ({news['edition']}, {news['published']})")
         print(f"링크: {news['link']}\n")
-    
+
     # 키워드 검색
     print("\n=== 'AI' 관련 뉴스 ===")
     ai_news = crawler.search_news(keyword="AI", max_results=5)
     for news in ai_news:
         print(f"제목: {news['title']}")
-        print(f"출처: {news['source']}")
+        print(f"출처: {news['source']} ({news['edition']}, {news['published']})")
         print(f"링크: {news['link']}\n")
+
+    # 기사 본문 수집
+    print("\n=== 'AI' 관련 기사 본문 ===")
+    for news in crawler.enrich_news(ai_news, max_articles=3):
+        print(f"제목: {news['title']}")
+        print(f"본문: {news.get('content', '(본문 없음)')[:200]}\n")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# AIchatbot 모듈은 패키지가 아닌 평면 구조이므로 상위 디렉터리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
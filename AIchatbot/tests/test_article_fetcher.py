@@ -0,0 +1,142 @@
+"""
+article_fetcher 모듈 테스트 (저장된 Google News 중계 페이지 사용)
+"""
+import logging
+import os
+import threading
+import time
+
+import requests
+
+from article_fetcher import ArticleFetcher, get_shared_fetcher
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+RELAY_URL = "https://news.google.com/rss/articles/CBMiK2h0dHBzOi8vbmV3cy5leGFtcGxlLmNvbS9haS1hcnRpY2xlLTEyMy5odG1s0gEA?oc=5"
+ARTICLE_URL = "https://news.example.com/ai-article-123.html"
+
+
+def read_data(name):
+    with open(os.path.join(DATA_DIR, name), "rb") as f:
+        return f.read()
+
+
+class FakeResponse:
+    """requests 스트리밍 응답을 흉내 내는 객체"""
+
+    def __init__(self, url, body):
+        self.url = url
+        self.body = body
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.encoding = "utf-8"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+class StalledResponse(FakeResponse):
+    """첫 조각을 보낸 뒤 멈췄다가 마감 이후 읽기 제한 시간 초과로 끊기는 응답"""
+
+    def __init__(self, url, body, split_at, stall):
+        super().__init__(url, body)
+        self.split_at = split_at
+        self.stall = stall
+
+    def iter_content(self, chunk_size):
+        yield self.body[:self.split_at]
+        time.sleep(self.stall)
+        raise requests.exceptions.ConnectionError("Read timed out.")
+
+
+class FakeSession:
+    """URL별로 저장된 페이지를 돌려주고 요청 기록을 남기는 세션"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, timeout, stream):
+        self.requests.append((url, timeout))
+        return FakeResponse(url, self.pages[url])
+
+
+def make_fetcher(pages):
+    fetcher = ArticleFetcher(max_workers=2, timeout=3, max_bytes=100000, max_chars=3000, cache_size=8)
+    fetcher.session = FakeSession(pages)
+    return fetcher
+
+
+def test_fetch_text_follows_relay_page_to_article():
+    fetcher = make_fetcher({
+        RELAY_URL: read_data("google_news_relay.html"),
+        ARTICLE_URL: read_data("article.html"),
+    })
+
+    text = fetcher.fetch_text(RELAY_URL, time.monotonic() + 5, threading.Event())
+
+    assert [url for url, _ in fetcher.session.requests] == [RELAY_URL, ARTICLE_URL]
+    assert text.splitlines() == [
+        "생성형 인공지능이 제조와 금융, 의료 등 산업 전반으로 빠르게 확산되고 있다.",
+        "전문가들은 올해 기업들의 AI 도입 예산이 지난해보다 두 배 이상 늘어날 것으로 내다봤다.",
+    ]
+    # 같은 링크는 캐시에서 반환
+    assert fetcher.fetch_text(RELAY_URL, time.monotonic() + 5, threading.Event()) == text
+    assert len(fetcher.session.requests) == 2
+
+
+def test_fetch_text_logs_relay_page_without_source(caplog):
+    fetcher = make_fetcher({RELAY_URL: read_data("google_news_relay_no_source.html")})
+
+    with caplog.at_level(logging.DEBUG, logger="article_fetcher"):
+        text = fetcher.fetch_text(RELAY_URL, time.monotonic() + 5, threading.Event())
+
+    assert text == ""
+    assert "원문 주소를 찾지 못함" in caplog.text
+
+
+def test_fetch_text_caps_timeout_and_skips_after_deadline():
+    pages = {
+        RELAY_URL: read_data("google_news_relay.html"),
+        ARTICLE_URL: read_data("article.html"),
+    }
+    fetcher = make_fetcher(pages)
+
+    fetcher.fetch_text(RELAY_URL, time.monotonic() + 0.5, threading.Event())
+    # 중계 페이지와 원문 요청 모두 남은 시간 안에서만 대기
+    assert all(timeout <= 0.5 for _, timeout in fetcher.session.requests)
+
+    fetcher = make_fetcher(pages)
+    cancel = threading.Event()
+    cancel.set()
+    assert fetcher.fetch_text(RELAY_URL, time.monotonic() + 5, cancel) == ""
+    assert fetcher.fetch_text(RELAY_URL, time.monotonic() - 1, threading.Event()) == ""
+    assert fetcher.session.requests == []
+
+
+def test_fetch_text_does_not_cache_partial_text():
+    body = read_data("article.html")
+    split_at = body.index("<p>전문가".encode())
+    fetcher = make_fetcher({ARTICLE_URL: body})
+    fetcher.session.get = lambda url, timeout, stream: StalledResponse(url, body, split_at, 0.3)
+
+    partial = fetcher.fetch_text(ARTICLE_URL, time.monotonic() + 0.2, threading.Event())
+    assert partial == "생성형 인공지능이 제조와 금융, 의료 등 산업 전반으로 빠르게 확산되고 있다."
+
+    # 중간에 멈춘 본문은 캐시되지 않으므로 다시 요청하면 전체 본문을 읽음
+    fetcher.session = FakeSession({ARTICLE_URL: body})
+    text = fetcher.fetch_text(ARTICLE_URL, time.monotonic() + 5, threading.Event())
+    assert len(text.splitlines()) == 2
+    assert len(fetcher.session.requests) == 1
+
+
+def test_shared_fetcher_is_reused():
+    assert get_shared_fetcher() is get_shared_fetcher()
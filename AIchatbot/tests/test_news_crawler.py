@@ -0,0 +1,102 @@
+"""
+news_crawler 모듈 테스트 (에디션 조회는 저장된 결과로 대체)
+"""
+import time
+from datetime import datetime, timezone
+
+from news_crawler import NewsCrawler
+
+
+def make_news(link, edition, published_at=None):
+    return {
+        "title": link,
+        "link": link,
+        "published": published_at.strftime("%Y-%m-%d %H:%M") if published_at else "",
+        "published_at": published_at,
+        "summary": "",
+        "source": "Example",
+        "edition": edition
+    }
+
+
+def make_crawler(results, timeout=1.0, delays=None):
+    """에디션별 결과를 돌려주도록 _fetch_edition을 대체한 크롤러"""
+    crawler = NewsCrawler(editions=list(results), timeout=timeout)
+    delays = delays or {}
+
+    def fetch_edition(url, edition):
+        time.sleep(delays.get(edition, 0))
+        return results[edition]
+
+    crawler._fetch_edition = fetch_edition
+    return crawler
+
+
+def test_edition_params_with_and_without_region():
+    assert NewsCrawler._edition_params("ko-KR") == "hl=ko-KR&gl=KR&ceid=KR:ko"
+    assert NewsCrawler._edition_params("en") == "hl=en"
+
+
+def test_collect_merges_google_links_across_editions():
+    published_at = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    crawler = make_crawler({
+        "ko-KR": [make_news("https://news.google.com/rss/articles/CBMiAbc?oc=5&hl=ko", "ko-KR")],
+        "en-US": [make_news("https://news.google.com/rss/articles/CBMiAbc?oc=5&hl=en-US", "en-US", published_at)],
+    })
+
+    news_list = crawler.search_news("AI")
+
+    # 같은 기사는 발행 시각 정보가 있는 쪽을 유지
+    assert len(news_list) == 1
+    assert news_list[0]["edition"] == "en-US"
+
+
+def test_collect_keeps_non_google_links_differing_by_query():
+    crawler = make_crawler({
+        "ko-KR": [make_news("https://news.example.com/view.php?id=1", "ko-KR")],
+        "en-US": [make_news("https://news.example.com/view.php?id=2", "en-US")],
+    })
+
+    links = {news["link"] for news in crawler.search_news("AI")}
+
+    assert links == {"https://news.example.com/view.php?id=1", "https://news.example.com/view.php?id=2"}
+
+
+def test_collect_drops_timed_out_edition():
+    crawler = make_crawler({
+        "ko-KR": [make_news("https://news.example.com/fast", "ko-KR")],
+        "en-US": [make_news("https://news.example.com/slow", "en-US")],
+    }, timeout=0.2, delays={"en-US": 1.0})
+
+    start = time.monotonic()
+    news_list = crawler.search_news("AI")
+
+    assert time.monotonic() - start < 0.8
+    assert [news["link"] for news in news_list] == ["https://news.example.com/fast"]
+
+
+def test_collect_sorts_by_recency_with_missing_dates_last():
+    older = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    newer = datetime(2026, 10, 2, tzinfo=timezone.utc)
+    crawler = make_crawler({
+        "ko-KR": [
+            make_news("https://news.example.com/undated", "ko-KR"),
+            make_news("https://news.example.com/older", "ko-KR", older),
+        ],
+        "en-US": [make_news("https://news.example.com/newer", "en-US", newer)],
+    })
+
+    links = [news["link"] for news in crawler.search_news("AI", max_results=3)]
+
+    assert links == [
+        "https://news.example.com/newer",
+        "https://news.example.com/older",
+        "https://news.example.com/undated",
+    ]
+
+
+def test_parse_published_converts_to_utc():
+    entry = {"published": "Mon, 19 Oct 2026 09:30:00 +0900"}
+
+    assert NewsCrawler._parse_published(entry) == datetime(2026, 10, 19, 0, 30, tzinfo=timezone.utc)
+    assert NewsCrawler._parse_published({}) is None
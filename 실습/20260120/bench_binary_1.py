@@ -0,0 +1,72 @@
+"""
+binary_1.py 실행 방식별 속도 비교
+
+사용법: python bench_binary_1.py [테스트 케이스 수] [16진수 길이]
+"""
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(HERE, 'binary_1.py')
+MODES = ['--line', '--bulk', '--stream']
+
+# 자릿수가 num과 다르거나 T=0인 경우 (모든 모드가 --line과 같은 출력을 내야 함)
+EDGE_CASES = [
+    b'1\n2 00F\n',
+    b'2\n3 F\n4 000F\n',
+    b'0\n',
+]
+
+
+def make_input(t, length):
+    """T개의 '글자 수 16진수' 테스트 케이스 생성"""
+    lines = [str(t)]
+    for _ in range(t):
+        hex_num = ''.join(random.choice('0123456789ABCDEF') for _ in range(length))
+        lines.append(f'{length} {hex_num}')
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def run(mode, input_path):
+    """모드 하나를 실행해 (소요 시간, 출력) 반환"""
+    with open(input_path, 'rb') as f:
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, SCRIPT, mode], stdin=f, capture_output=True, check=True)
+        return time.perf_counter() - start, result.stdout
+
+
+def check_edge_cases():
+    """특수한 입력에서 모드별 출력이 --line과 같은지 확인"""
+    for data in EDGE_CASES:
+        outputs = [
+            subprocess.run([sys.executable, SCRIPT, mode], input=data, capture_output=True, check=True).stdout
+            for mode in MODES
+        ]
+        status = 'OK' if all(output == outputs[0] for output in outputs) else '출력 불일치'
+        print(f'특수 입력 {data!r}: {status}')
+
+
+if __name__ == '__main__':
+    t = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+
+    with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+        f.write(make_input(t, length))
+        input_path = f.name
+
+    try:
+        check_edge_cases()
+        print(f'T={t}, 16진수 길이={length}')
+        expected = None
+        for mode in MODES:
+            elapsed, output = run(mode, input_path)
+            if expected is None:
+                expected = output
+            status = 'OK' if output == expected else '출력 불일치'
+            print(f'{mode:>9}: {elapsed:.3f}초 ({status})')
+    finally:
+        os.remove(input_path)
@@ -1,12 +1,136 @@
-t = input()
-for i in range(t):
-    num, hex_num = input().split()
-    
-    ten_num = int(hex_num, 16)       # 10진수로 변환
-    bin_num = bin(ten_num)[2:]       # 2진수 문자열로 변환 ('0b' 제거)
-    
-    # 16진수 글자 수 * 4 만큼의 자릿수를 맞추고, 앞을 0으로 채움
-    total_len = int(num) * 4
-    result = bin_num.zfill(total_len) 
-    
-    print(f'#{i+1} {result}')
\ No newline at end of file
+import itertools
+import re
+import sys
+
+NON_SPACE = re.compile(rb'\S')
+SPACE = re.compile(rb'\s')
+
+
+def hex_to_bits(hex_num, num=0):
+    """16진수 바이트열을 2진수 바이트열로 변환 (num 글자 * 4 자리에 맞춰 앞을 0으로 채움)"""
+    total_len = num * 4
+    if not hex_num:
+        return b'0' * total_len
+    # int()/bin()은 C로 구현되어 길이에 비례하는 시간에 변환됨
+    return bin(int(hex_num, 16))[2:].zfill(total_len).encode()
+
+
+def solve_per_line():
+    """한 줄씩 input()으로 읽어 변환 (기존 방식)"""
+    t = int(input())
+    for i in range(t):
+        num, hex_num = input().split()
+
+        ten_num = int(hex_num, 16)       # 10진수로 변환
+        bin_num = bin(ten_num)[2:]       # 2진수 문자열로 변환 ('0b' 제거)
+
+        # 16진수 글자 수 * 4 만큼의 자릿수를 맞추고, 앞을 0으로 채움
+        total_len = int(num) * 4
+        result = bin_num.zfill(total_len)
+
+        print(f'#{i+1} {result}')
+
+
+def solve_bulk(data):
+    """입력 전체(bytes)를 한 번에 변환해 출력 전체(bytes)를 반환"""
+    tokens = data.split()
+    t = int(tokens[0])
+    if t == 0:
+        return b''
+    result = []
+    for i in range(t):
+        num = int(tokens[2 * i + 1])
+        hex_num = tokens[2 * i + 2]
+        result.append(b'#%d %s' % (i + 1, hex_to_bits(hex_num, num)))
+    return b'\n'.join(result) + b'\n'
+
+
+class TokenReader:
+    """입력을 일정 크기씩 읽으며 토큰을 조각 단위로 돌려주는 리더 (메모리보다 큰 입력용)"""
+
+    def __init__(self, reader, chunk_size=1 << 20):
+        self.reader = reader
+        self.chunk_size = chunk_size
+        self.buffer = b''
+        self.pos = 0
+
+    def fill(self):
+        self.buffer = self.reader.read(self.chunk_size)
+        self.pos = 0
+        return bool(self.buffer)
+
+    def iter_token(self):
+        # 앞쪽 공백 건너뛰기
+        while True:
+            match = NON_SPACE.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                break
+            if not self.fill():
+                return
+
+        # 공백이 나올 때까지 읽은 조각을 차례로 반환
+        while True:
+            match = SPACE.search(self.buffer, self.pos)
+            if match:
+                yield self.buffer[self.pos:match.start()]
+                self.pos = match.start()
+                return
+            yield self.buffer[self.pos:]
+            if not self.fill():
+                return
+
+    def read_token(self):
+        return b''.join(self.iter_token())
+
+
+def iter_bits(pieces, num, chunk_size):
+    """16진수 토큰 조각을 2진수 조각으로 변환 (chunk_size 이내에서 끝나는 토큰은 일괄 모드와 같은 자릿수)"""
+    head = []
+    head_size = 0
+    for piece in pieces:
+        head.append(piece)
+        head_size += len(piece)
+        if head_size > chunk_size:
+            break
+    else:
+        yield hex_to_bits(b''.join(head), num)
+        return
+
+    # 긴 토큰은 자릿수가 num과 같다고 보고 조각마다 글자 수 * 4 자리로 변환
+    for piece in itertools.chain(head, pieces):
+        yield hex_to_bits(piece, len(piece))
+
+
+def solve_stream(reader, writer, chunk_size=1 << 20):
+    """입력을 조각 단위로 읽으며 바로 변환해 출력 (chunk_size보다 긴 16진수는 자릿수가 num과 같다고 가정)"""
+    tokens = TokenReader(reader, chunk_size)
+    t = int(tokens.read_token())
+    result = []
+    result_size = 0
+    for i in range(t):
+        num = int(tokens.read_token())
+        result.append(b'#%d ' % (i + 1))
+        for bits in iter_bits(tokens.iter_token(), num, chunk_size):
+            result.append(bits)
+            result_size += len(bits)
+
+            # 모아둔 출력이 chunk_size를 넘으면 한 번에 쓰기
+            if result_size >= chunk_size:
+                writer.write(b''.join(result))
+                result = []
+                result_size = 0
+        result.append(b'\n')
+    writer.write(b''.join(result))
+    writer.flush()
+
+
+if __name__ == '__main__':
+    mode = sys.argv[1] if len(sys.argv) > 1 else '--bulk'
+
+    if mode == '--line':
+        solve_per_line()
+    elif mode == '--stream':
+        solve_stream(sys.stdin.buffer, sys.stdout.buffer)
+    else:
+        sys.stdout.buffer.write(solve_bulk(sys.stdin.buffer.read()))